@@ -0,0 +1,101 @@
+import csv
+import json
+import sqlite3
+
+import pytest
+
+import zstd_to_csv_converter as converter
+
+
+def write_json_lines(path, rows):
+    with open(path, 'w') as json_file:
+        for row in rows:
+            json_file.write(json.dumps(row) + '\n')
+
+
+def sample_rows(count):
+    return [
+        {'timestamp': 1700000000 + i, 'host': f'h{i % 3}', 'response_status': 200, 'resTime': 0.5, 'response_body_size': i, 'geo_city': {'name': 'Pune'}}
+        for i in range(count)
+    ]
+
+
+def test_sqlite_columns_are_typed(tmp_path):
+    json_path = tmp_path / 'logs.json'
+    db_path = tmp_path / 'logs.db'
+    write_json_lines(json_path, sample_rows(1))
+
+    converter.convert_json_to_sqlite(str(json_path), str(db_path))
+
+    with sqlite3.connect(db_path) as conn:
+        row = conn.execute(
+            'SELECT typeof(timestamp), typeof(response_status), typeof(resTime), typeof(response_body_size), geo_city, url FROM logs'
+        ).fetchone()
+    assert row == ('integer', 'integer', 'real', 'integer', '{"name": "Pune"}', None)
+
+
+def test_sqlite_loads_partial_final_batch(tmp_path):
+    json_path = tmp_path / 'logs.json'
+    db_path = tmp_path / 'logs.db'
+    write_json_lines(json_path, sample_rows(7))
+
+    assert converter.convert_json_to_sqlite(str(json_path), str(db_path), batch_size=3) == 7
+
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute('SELECT count(*) FROM logs').fetchone() == (7,)
+
+
+def test_sqlite_indexes_exist_after_load(tmp_path):
+    json_path = tmp_path / 'logs.json'
+    db_path = tmp_path / 'logs.db'
+    write_json_lines(json_path, sample_rows(2))
+
+    converter.convert_json_to_sqlite(str(json_path), str(db_path))
+
+    with sqlite3.connect(db_path) as conn:
+        indexes = {name for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert indexes == {'idx_logs_timestamp', 'idx_logs_host_timestamp', 'idx_logs_response_status'}
+
+
+def test_sqlite_rerun_replaces_database(tmp_path):
+    json_path = tmp_path / 'logs.json'
+    db_path = tmp_path / 'logs.db'
+    write_json_lines(json_path, sample_rows(2))
+
+    converter.convert_json_to_sqlite(str(json_path), str(db_path))
+    converter.convert_json_to_sqlite(str(json_path), str(db_path))
+
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute('SELECT count(*) FROM logs').fetchone() == (2,)
+    assert not (tmp_path / 'logs.db.tmp').exists()
+
+
+def test_csv_and_sqlite_written_in_one_pass(tmp_path):
+    json_path = tmp_path / 'logs.json'
+    db_path = tmp_path / 'logs.db'
+    write_json_lines(json_path, sample_rows(5))
+
+    converter.convert_json_to_csv(str(json_path), str(tmp_path / 'out'), 3, str(db_path), batch_size=2)
+
+    with open(tmp_path / 'out_1.csv', newline='') as csv_file:
+        assert len(list(csv.reader(csv_file))) == 4
+    with open(tmp_path / 'out_2.csv', newline='') as csv_file:
+        assert len(list(csv.reader(csv_file))) == 3
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute('SELECT count(*) FROM logs').fetchone() == (5,)
+
+
+def test_failed_load_keeps_existing_database(tmp_path):
+    json_path = tmp_path / 'logs.json'
+    db_path = tmp_path / 'logs.db'
+    write_json_lines(json_path, sample_rows(2))
+    converter.convert_json_to_sqlite(str(json_path), str(db_path))
+
+    with open(json_path, 'a') as json_file:
+        json_file.write('not json\n')
+    with pytest.raises(json.JSONDecodeError):
+        converter.convert_json_to_sqlite(str(json_path), str(db_path))
+
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute('SELECT count(*) FROM logs').fetchone() == (2,)
+    assert not (tmp_path / 'logs.db.tmp').exists()
@@ -1,5 +1,6 @@
 import json
 import csv
+import sqlite3
 import zstandard as zstd
 import os
 
@@ -10,36 +11,151 @@ def decompress_zstd_file(input_file, output_file):
             dctx.copy_stream(compressed_file, decompressed_file)
     print(f"Decompression complete. File saved as {output_file}")
 
-def convert_json_to_csv(input_file, output_file_base, rows_per_file):
-    headers = ['timestamp', 'geo_city', 'response_status', 'org', 'apiKey', 'shield', 'cache', 'host', 'pop', 'resTime', 'response_body_size', 'request_user_agent', 'response_body_size', 'url'] 
+HEADERS = ['timestamp', 'geo_city', 'response_status', 'org', 'apiKey', 'shield', 'cache', 'host', 'pop', 'resTime', 'response_body_size', 'request_user_agent', 'response_body_size', 'url']
+
+# SQLite needs unique column names, so the duplicate header is dropped here only.
+SQLITE_COLUMNS = list(dict.fromkeys(HEADERS))
+
+# SQLite column types for the converter headers; anything not listed is TEXT.
+# NUMERIC keeps epoch timestamps as numbers and ISO timestamps as text.
+SQLITE_COLUMN_TYPES = {
+    'timestamp': 'NUMERIC',
+    'response_status': 'INTEGER',
+    'resTime': 'REAL',
+    'response_body_size': 'INTEGER',
+}
+
+def open_sqlite_db(db_file, table_name='logs'):
+    # The load always goes into a fresh scratch file that replaces db_file once
+    # it is complete, so a re-run rebuilds the database (like the CSV files are
+    # overwritten) and a failed load never touches an existing one.
+    tmp_file = f"{db_file}.tmp"
+    if os.path.exists(tmp_file):
+        os.remove(tmp_file)
+
+    conn = sqlite3.connect(tmp_file, isolation_level=None)
+    # Bulk-load settings: no fsync, journal kept in memory so a batch can still roll back
+    conn.execute('PRAGMA journal_mode = MEMORY')
+    conn.execute('PRAGMA synchronous = OFF')
+    conn.execute('PRAGMA temp_store = MEMORY')
+    conn.execute('PRAGMA cache_size = -262144')  # 256 MiB
+    column_defs = ', '.join(f'"{col}" {SQLITE_COLUMN_TYPES.get(col, "TEXT")}' for col in SQLITE_COLUMNS)
+    conn.execute(f'CREATE TABLE "{table_name}" ({column_defs})')
+    return conn
+
+def sqlite_row(data):
+    # Missing keys are stored as NULL, whereas the CSV files write ''.
+    # Filter the database with "IS NULL" where the CSVs would be filtered on ''.
+    row = []
+    for key in SQLITE_COLUMNS:
+        value = data.get(key)
+        if isinstance(value, (dict, list)):
+            value = json.dumps(value)
+        row.append(value)
+    return row
+
+def insert_sqlite_batch(conn, table_name, batch):
+    column_names = ', '.join(f'"{col}"' for col in SQLITE_COLUMNS)
+    placeholders = ', '.join('?' for _ in SQLITE_COLUMNS)
+    conn.execute('BEGIN')
+    try:
+        conn.executemany(f'INSERT INTO "{table_name}" ({column_names}) VALUES ({placeholders})', batch)
+    except Exception:
+        conn.execute('ROLLBACK')
+        raise
+    conn.execute('COMMIT')
+
+def close_sqlite_db(conn, db_file, table_name='logs'):
+    # Build indexes once after the load rather than updating them per insert
+    conn.execute(f'CREATE INDEX "idx_{table_name}_timestamp" ON "{table_name}" ("timestamp")')
+    conn.execute(f'CREATE INDEX "idx_{table_name}_host_timestamp" ON "{table_name}" ("host", "timestamp")')
+    conn.execute(f'CREATE INDEX "idx_{table_name}_response_status" ON "{table_name}" ("response_status")')
+    conn.execute('ANALYZE')
+    conn.execute('PRAGMA journal_mode = DELETE')
+    conn.close()
+    os.replace(f"{db_file}.tmp", db_file)
+
+def discard_sqlite_db(conn, db_file):
+    conn.close()
+    os.remove(f"{db_file}.tmp")
+
+def convert_json_to_csv(input_file, output_file_base, rows_per_file, db_file=None, table_name='logs', batch_size=100000):
     file_count = 1
     row_count = 0 # Initialize row count to 0
+    # Optionally load the same parsed rows into SQLite in this single pass
+    conn = open_sqlite_db(db_file, table_name) if db_file else None
+    batch = []
+
+    try:
+        with open(input_file, 'r') as json_file:
+            csv_file = open(f"{output_file_base}_{file_count}.csv", 'w', newline='')
+            writer = csv.DictWriter(csv_file, fieldnames=HEADERS)
+            writer.writeheader()
 
-    with open(input_file, 'r') as json_file:
-        csv_file = open(f"{output_file_base}_{file_count}.csv", 'w', newline='')
-        writer = csv.DictWriter(csv_file, fieldnames=headers)
-        writer.writeheader()
+            for line in json_file:
+                if line.strip():
+                    data = json.loads(line)
+                    row = {key: data.get(key, '') for key in HEADERS}
+                    writer.writerow(row)
+                    row_count += 1
 
-        for line in json_file:
-            if line.strip():
-                data = json.loads(line)
-                row = {key: data.get(key, '') for key in headers}
-                writer.writerow(row)
-                row_count += 1
+                    if conn:
+                        batch.append(sqlite_row(data))
+                        if len(batch) >= batch_size:
+                            insert_sqlite_batch(conn, table_name, batch)
+                            batch = []
 
-                if row_count >= rows_per_file:
-                    csv_file.close()
-                    file_count += 1
-                    row_count = 0
-                    csv_file = open(f"{output_file_base}_{file_count}.csv", 'w', newline='')
-                    writer = csv.DictWriter(csv_file, fieldnames=headers)
-                    writer.writeheader()
+                    if row_count >= rows_per_file:
+                        csv_file.close()
+                        file_count += 1
+                        row_count = 0
+                        csv_file = open(f"{output_file_base}_{file_count}.csv", 'w', newline='')
+                        writer = csv.DictWriter(csv_file, fieldnames=HEADERS)
+                        writer.writeheader()
 
-        csv_file.close()
+            csv_file.close()
+
+        if conn:
+            if batch:
+                insert_sqlite_batch(conn, table_name, batch)
+            close_sqlite_db(conn, db_file, table_name)
+    except Exception:
+        if conn:
+            discard_sqlite_db(conn, db_file)
+        raise
 
     print(f"Conversion complete. CSV files saved as {output_file_base}_1.csv, {output_file_base}_2.csv, etc.")
+    if db_file:
+        print(f"Rows also saved to table {table_name} in {db_file}")
+
+def convert_json_to_sqlite(input_file, db_file, table_name='logs', batch_size=100000):
+    # SQLite-only load; db_file is replaced on every run (see open_sqlite_db)
+    total_rows = 0
+    conn = open_sqlite_db(db_file, table_name)
+    batch = []
+
+    try:
+        with open(input_file, 'r') as json_file:
+            for line in json_file:
+                if line.strip():
+                    batch.append(sqlite_row(json.loads(line)))
+                    if len(batch) >= batch_size:
+                        insert_sqlite_batch(conn, table_name, batch)
+                        total_rows += len(batch)
+                        batch = []
+
+        if batch:
+            insert_sqlite_batch(conn, table_name, batch)
+            total_rows += len(batch)
+        close_sqlite_db(conn, db_file, table_name)
+    except Exception:
+        discard_sqlite_db(conn, db_file)
+        raise
+
+    print(f"Load complete. {total_rows} rows saved to table {table_name} in {db_file}")
+    return total_rows
 
-def process_file(input_zstd, output_json, output_csv_base, rows_per_file=1000000): 
+def process_file(input_zstd, output_json, output_csv_base, rows_per_file=1000000, output_db=None): 
     # Step 1: Decompress the zstd file
     decompress_zstd_file(input_zstd, output_json)
     
@@ -49,16 +165,19 @@ def process_file(input_zstd, output_json, output_csv_base, rows_per_file=1000000
         return
     
     # Step 3: Convert the decompressed JSON to CSV with specific fields
-    convert_json_to_csv(output_json, output_csv_base, rows_per_file)
+    # (and optionally load the same rows into a SQLite database)
+    convert_json_to_csv(output_json, output_csv_base, rows_per_file, output_db)
 
-# Usage
-# Update the input path
-input_zstd = '/input-files/Test_Log.zst'  # Your zstd compressed input file
-# input_zstd = 'Test_Log.zst'  # Your zstd compressed input file
-output_json = 'Test.json'  # Decompressed JSON file
-output_csv_base = 'Test'  # Base name for output CSV files 
-rows_per_file = 1000000     # Example: Split into files of 500,000 rows each
+if __name__ == '__main__':
+    # Usage
+    # Update the input path
+    input_zstd = '/input-files/Test_Log.zst'  # Your zstd compressed input file
+    # input_zstd = 'Test_Log.zst'  # Your zstd compressed input file
+    output_json = 'Test.json'  # Decompressed JSON file
+    output_csv_base = 'Test'  # Base name for output CSV files 
+    rows_per_file = 1000000     # Example: Split into files of 500,000 rows each
+    output_db = None  # e.g. 'Test.db' to also load the rows into SQLite
 
-process_file(input_zstd, output_json, output_csv_base, rows_per_file)
+    process_file(input_zstd, output_json, output_csv_base, rows_per_file, output_db)
 
 #Hello